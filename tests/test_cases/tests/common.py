@@ -12,14 +12,18 @@
 # *******************************************************************************
 import logging
 import shutil
+from collections import defaultdict
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 from testing_utils import BazelTools, BuildTools, LogContainer, Scenario
 
 logger = logging.getLogger(__name__)
 
+# Test scenario implementations, used for 'version' parametrization.
+VERSIONS = ["rust", "cpp"]
+
 
 class ResultCode:
     """
@@ -97,6 +101,22 @@ class CommonScenario(Scenario):
         """
         return logs_target.get_logs(field="level", value="INFO")
 
+    @pytest.fixture(scope="class")
+    def logs_by_key(self, logs_info_level: LogContainer) -> dict[Any, list[Any]]:
+        """
+        Logs with messages with INFO level, grouped by "key" field value.
+        Built in a single pass, allows lookups without rescanning logs.
+
+        Parameters
+        ----------
+        logs_info_level : LogContainer
+            Logs with messages with INFO level.
+        """
+        logs = defaultdict(list)
+        for log in logs_info_level.get_logs(field="key"):
+            logs[log.key].append(log)
+        return dict(logs)
+
     @pytest.fixture(autouse=True)
     def print_to_report(
         self,
@@ -19,7 +19,6 @@ import pytest
 from testing_utils import BazelTools
 
 logger = logging.getLogger(__name__)
-FAILED_CONFIGS = []
 
 
 # Cmdline options
@@ -77,6 +76,10 @@ def pytest_addoption(parser):
 # Hooks
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart(session):
+    # Scenarios are built once by the controller when running with 'pytest-xdist'.
+    if hasattr(session.config, "workerinput"):
+        return
+
     try:
         # Build scenarios.
         if session.config.getoption("--build-scenarios"):
@@ -148,25 +151,23 @@ def pytest_runtest_makereport(item, call):
             "-- --name",
         )
 
-    # Store failed command for printing in summary
-    if report.failed:
-        FAILED_CONFIGS.append(
-            {
-                "nodeid": report.nodeid,
-                "command": report.command,
-            }
-        )
-
 
 def pytest_terminal_summary(terminalreporter):
-    if not FAILED_CONFIGS:
+    # Collect failed reports, 'pytest-xdist' forwards report attributes from workers
+    failed_reports = [
+        report
+        for key in ("failed", "error")
+        for report in terminalreporter.stats.get(key, [])
+        if hasattr(report, "command")
+    ]
+    if not failed_reports:
         return
     # Print failed scenarios info
     terminalreporter.write_sep("=", "Failed tests reproduction info")
     terminalreporter.write_line("Run failed scenarios from the repo root working directory\n")
 
-    for entry in FAILED_CONFIGS:
-        terminalreporter.write_line(f"{entry['nodeid']} | Run command:\n{entry['command']}\n")
+    for report in failed_reports:
+        terminalreporter.write_line(f"{report.nodeid} | Run command:\n{report.command}\n")
 
 
 def pytest_collection_modifyitems(items: list[pytest.Function]):
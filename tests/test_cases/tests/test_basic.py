@@ -17,11 +17,12 @@ Smoke test for Rust-C++ tests.
 from typing import Any
 
 import pytest
-from common import CommonScenario, ResultCode
+from common import VERSIONS, CommonScenario, ResultCode
 from testing_utils import LogContainer, ScenarioResult
 
 
-@pytest.mark.parametrize("version", ["cpp", "rust"], scope="class")
+@pytest.mark.parametrize("version", VERSIONS, scope="class")
+@pytest.mark.xdist_group(name="default_kvs_dir")
 class TestBasic(CommonScenario):
     @pytest.fixture(scope="class")
     def scenario_name(self, *_, **__) -> str:
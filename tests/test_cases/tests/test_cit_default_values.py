@@ -12,38 +12,62 @@
 # *******************************************************************************
 import json
 import re
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Generator
 from zlib import adler32
 
 import pytest
-from common import CommonScenario, ResultCode, temp_dir_common
+from common import VERSIONS, CommonScenario, ResultCode, temp_dir_common
 from test_properties import add_test_properties
 from testing_utils import LogContainer, ScenarioResult
 
-pytestmark = pytest.mark.parametrize("version", ["rust", "cpp"], scope="class")
+pytestmark = pytest.mark.parametrize("version", VERSIONS, scope="class")
+
+# Error messages printed to stderr when KVS instance fails to open.
+# Rust panics with the error code, C++ reports generic build failure.
+JSON_PARSER_ERROR_PATTERNS = {
+    "rust": re.compile(r"Failed to create KVS instance: JsonParserError"),
+    "cpp": re.compile(r"Failed to build KVS instance"),
+}
+FILE_NOT_FOUND_ERROR_PATTERNS = {
+    "rust": re.compile(r"Failed to create KVS instance: FileNotFound"),
+    "cpp": re.compile(r"Failed to build KVS instance"),
+}
 
 
 # Type tag and value pair.
 TaggedValue = tuple[str, Any]
 
+# Get '(value_is_default, default_value, current_value)' from a log entry.
+logged_values = attrgetter("value_is_default", "default_value", "current_value")
+
+# Number of values used by reset tests.
+# Must match 'num_values' in reset scenarios.
+RESET_NUM_VALUES = 5
+
+# Default values used by reset tests.
+# Built once at import, defaults file is still written for each parametrization.
+RESET_DEFAULT_VALUES = {f"test_number_{i}": ("f64", 432.1 * i) for i in range(RESET_NUM_VALUES)}
+
+# Values set by reset scenarios before reset.
+RESET_SET_VALUES = {f"test_number_{i}": 123.4 * i for i in range(RESET_NUM_VALUES)}
+
 
 def create_defaults_json(values: dict[str, TaggedValue]) -> str:
     """
     Create JSON string containing default values.
     """
     # Create defaults.
-    json_value = dict()
-    for key, tagged_value in values.items():
-        type_tag, value = tagged_value
-        json_value[key] = {"t": type_tag, "v": value}
+    json_value = {key: {"t": type_tag, "v": value} for key, (type_tag, value) in values.items()}
 
-    return json.dumps(json_value)
+    # Use compact separators, whitespace is not required by the parsers.
+    return json.dumps(json_value, separators=(",", ":"))
 
 
-def create_defaults_file(dir_path: Path, instance_id: int, values: dict[str, TaggedValue]) -> Path:
+def write_defaults_file(dir_path: Path, instance_id: int, data: bytes) -> Path:
     """
-    Create file containing default values, along with a matching hash file.
+    Write raw default values file content, along with a matching hash file.
     Returns path to default values file.
     """
     # Path to expected defaults file.
@@ -53,29 +77,56 @@ def create_defaults_file(dir_path: Path, instance_id: int, values: dict[str, Tag
     # E.g., `/tmp/xyz/kvs_0_default.hash`.
     defaults_hash_file_path = dir_path / f"kvs_{instance_id}_default.hash"
 
-    # Create JSON string containing default values.
-    json_str = create_defaults_json(values)
-
-    # Generate hash.
-    hash = adler32(json_str.encode()).to_bytes(length=4, byteorder="big")
+    # Generate hash from the same bytes that are written.
+    hash_bytes = adler32(data).to_bytes(length=4, byteorder="big")
 
     # Save content and hash.
-    with open(defaults_file_path, mode="w", encoding="UTF-8") as file:
-        file.write(json_str)
-    with open(defaults_hash_file_path, mode="wb") as file:
-        file.write(hash)
+    defaults_file_path.write_bytes(data)
+    defaults_hash_file_path.write_bytes(hash_bytes)
 
     return defaults_file_path
 
 
+def create_defaults_file(dir_path: Path, instance_id: int, values: dict[str, TaggedValue]) -> Path:
+    """
+    Create file containing default values, along with a matching hash file.
+    Returns path to default values file.
+    """
+    # Create JSON string containing default values.
+    data = create_defaults_json(values).encode("UTF-8")
+
+    return write_defaults_file(dir_path, instance_id, data)
+
+
 class DefaultValuesScenario(CommonScenario):
     """
     Common base implementation for default values tests.
     """
 
+    # Name of the test scenario, set by each test class.
+    SCENARIO_NAME: str
+
     def instance_id(self) -> int:
         return 1
 
+    @pytest.fixture(scope="class")
+    def scenario_name(self) -> str:
+        return self.SCENARIO_NAME
+
+    @pytest.fixture(scope="class")
+    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
+        # Use 'optional' for no defaults file to allow init.
+        if defaults == "without":
+            defaults = "optional"
+
+        return {
+            "kvs_parameters": {
+                "instance_id": self.instance_id(),
+                "dir": str(temp_dir),
+                "defaults": defaults,
+            }
+        }
+
     @pytest.fixture(scope="class")
     def temp_dir(
         self, tmp_path_factory: pytest.TempPathFactory, version: str, defaults: str
@@ -100,26 +151,12 @@ class DefaultValuesScenario(CommonScenario):
 class TestDefaultValues(DefaultValuesScenario):
     """Verifies default value loading, querying, and override behavior for KVS instances with and without defaults."""
 
+    SCENARIO_NAME = "cit.default_values.default_values"
     KEY = "test_number"
     VALUE = 111.1
-
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.default_values"
-
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        # Use 'optional' for no defaults file to allow init.
-        if defaults == "without":
-            defaults = "optional"
-
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
+    # Expected logged default and set values.
+    EXP_DEFAULT_VALUE = f"Ok(F64({VALUE}))"
+    EXP_SET_VALUE = "Ok(F64(432.1))"
 
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
@@ -146,23 +183,15 @@ class TestDefaultValues(DefaultValuesScenario):
 
         if defaults_file is not None:
             # Check values before change.
-            assert logs[0].value_is_default == "Ok(true)"
-            assert logs[0].default_value == f"Ok(F64({self.VALUE}))"
-            assert logs[0].current_value == f"Ok(F64({self.VALUE}))"
+            assert logged_values(logs[0]) == ("Ok(true)", self.EXP_DEFAULT_VALUE, self.EXP_DEFAULT_VALUE)
             # Check values after change.
-            assert logs[1].value_is_default == "Ok(false)"
-            assert logs[1].default_value == f"Ok(F64({self.VALUE}))"
-            assert logs[1].current_value == "Ok(F64(432.1))"
+            assert logged_values(logs[1]) == ("Ok(false)", self.EXP_DEFAULT_VALUE, self.EXP_SET_VALUE)
 
         else:
             # Check values before change.
-            assert logs[0].value_is_default == "Err(KeyNotFound)"
-            assert logs[0].default_value == "Err(KeyNotFound)"
-            assert logs[0].current_value == "Err(KeyNotFound)"
+            assert logged_values(logs[0]) == ("Err(KeyNotFound)", "Err(KeyNotFound)", "Err(KeyNotFound)")
             # Check values after change.
-            assert logs[1].value_is_default == "Ok(false)"
-            assert logs[1].default_value == "Err(KeyNotFound)"
-            assert logs[1].current_value == "Ok(F64(432.1))"
+            assert logged_values(logs[1]) == ("Ok(false)", "Err(KeyNotFound)", self.EXP_SET_VALUE)
 
 
 @add_test_properties(
@@ -178,26 +207,12 @@ class TestDefaultValues(DefaultValuesScenario):
 class TestRemoveKey(DefaultValuesScenario):
     """Tests removal of values in KVS with defaults enabled, ensuring keys revert to their default values."""
 
+    SCENARIO_NAME = "cit.default_values.remove_key"
     KEY = "test_number"
     VALUE = 111.1
-
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.remove_key"
-
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        # Use 'optional' for no defaults file to allow init.
-        if defaults == "without":
-            defaults = "optional"
-
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
+    # Expected logged default and set values.
+    EXP_DEFAULT_VALUE = f"Ok(F64({VALUE}))"
+    EXP_SET_VALUE = "Ok(F64(432.1))"
 
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
@@ -223,31 +238,19 @@ class TestRemoveKey(DefaultValuesScenario):
 
         if defaults_file is not None:
             # Check values before set.
-            assert logs[0].value_is_default == "Ok(true)"
-            assert logs[0].default_value == f"Ok(F64({self.VALUE}))"
-            assert logs[0].current_value == f"Ok(F64({self.VALUE}))"
+            assert logged_values(logs[0]) == ("Ok(true)", self.EXP_DEFAULT_VALUE, self.EXP_DEFAULT_VALUE)
             # Check values after set.
-            assert logs[1].value_is_default == "Ok(false)"
-            assert logs[1].default_value == f"Ok(F64({self.VALUE}))"
-            assert logs[1].current_value == "Ok(F64(432.1))"
+            assert logged_values(logs[1]) == ("Ok(false)", self.EXP_DEFAULT_VALUE, self.EXP_SET_VALUE)
             # Check values after remove.
-            assert logs[2].value_is_default == "Ok(true)"
-            assert logs[2].default_value == f"Ok(F64({self.VALUE}))"
-            assert logs[2].current_value == f"Ok(F64({self.VALUE}))"
+            assert logged_values(logs[2]) == ("Ok(true)", self.EXP_DEFAULT_VALUE, self.EXP_DEFAULT_VALUE)
 
         else:
             # Check values before set.
-            assert logs[0].value_is_default == "Err(KeyNotFound)"
-            assert logs[0].default_value == "Err(KeyNotFound)"
-            assert logs[0].current_value == "Err(KeyNotFound)"
+            assert logged_values(logs[0]) == ("Err(KeyNotFound)", "Err(KeyNotFound)", "Err(KeyNotFound)")
             # Check values after set.
-            assert logs[1].value_is_default == "Ok(false)"
-            assert logs[1].default_value == "Err(KeyNotFound)"
-            assert logs[1].current_value == "Ok(F64(432.1))"
+            assert logged_values(logs[1]) == ("Ok(false)", "Err(KeyNotFound)", self.EXP_SET_VALUE)
             # Check values after remove.
-            assert logs[2].value_is_default == "Err(KeyNotFound)"
-            assert logs[2].default_value == "Err(KeyNotFound)"
-            assert logs[2].current_value == "Err(KeyNotFound)"
+            assert logged_values(logs[2]) == ("Err(KeyNotFound)", "Err(KeyNotFound)", "Err(KeyNotFound)")
 
 
 @add_test_properties(
@@ -263,60 +266,32 @@ class TestRemoveKey(DefaultValuesScenario):
 class TestMalformedDefaultsFile(DefaultValuesScenario):
     """Verifies that KVS fails to open when the defaults file contains invalid JSON."""
 
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.default_values"
+    SCENARIO_NAME = "cit.default_values.default_values"
 
     def capture_stderr(self) -> bool:
         return True
 
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
-
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
         assert defaults in ("optional", "required")
 
-        # Path to expected defaults file.
-        # E.g., `/tmp/xyz/kvs_0_default.json`.
-        defaults_file_path = temp_dir / f"kvs_{self.instance_id()}_default.json"
-        # Path to expected defaults hash file.
-        # E.g., `/tmp/xyz/kvs_0_default.hash`.
-        defaults_hash_file_path = temp_dir / f"kvs_{self.instance_id()}_default.hash"
-
-        # Create malformed JSON string by removing last characters.
+        # Create malformed JSON by removing last characters.
         key = "test_number"
         value = 111.1
-        json_str = create_defaults_json({key: ("f64", value)})[:-2]
-
-        # Generate hash.
-        hash = adler32(json_str.encode()).to_bytes(length=4, byteorder="big")
-
-        # Save content and hash.
-        with open(defaults_file_path, mode="w", encoding="UTF-8") as file:
-            file.write(json_str)
-        with open(defaults_hash_file_path, mode="wb") as file:
-            file.write(hash)
+        data = create_defaults_json({key: ("f64", value)}).encode("UTF-8")[:-2]
 
-        return defaults_file_path
+        return write_defaults_file(temp_dir, self.instance_id(), data)
 
     def test_invalid(
         self,
         defaults_file: Path | None,
         results: ScenarioResult,
+        version: str,
     ) -> None:
         assert defaults_file is not None
         assert results.return_code == ResultCode.PANIC
         assert results.stderr is not None
-        pattern = r'error: file ".*" could not be read: JsonParserError'
-        assert re.findall(pattern, results.stderr) is not None
+        assert JSON_PARSER_ERROR_PATTERNS[version].search(results.stderr) is not None
 
 
 @add_test_properties(
@@ -332,28 +307,15 @@ class TestMalformedDefaultsFile(DefaultValuesScenario):
 class TestMissingDefaultsFile(DefaultValuesScenario):
     """Verifies that KVS fails to open when the defaults file is missing."""
 
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.default_values"
+    SCENARIO_NAME = "cit.default_values.default_values"
 
     def capture_stderr(self) -> bool:
         return True
 
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
-
-    def test_invalid(self, results: ScenarioResult) -> None:
+    def test_invalid(self, results: ScenarioResult, version: str) -> None:
         assert results.return_code == ResultCode.PANIC
         assert results.stderr is not None
-        pattern = r'error: file ".*" could not be read: KvsFileReadError'
-        assert re.findall(pattern, results.stderr) is not None
+        assert FILE_NOT_FOUND_ERROR_PATTERNS[version].search(results.stderr) is not None
 
 
 @add_test_properties(
@@ -370,37 +332,19 @@ class TestMissingDefaultsFile(DefaultValuesScenario):
 class TestResetAllKeys(DefaultValuesScenario):
     """Checks that resetting KVS restores all keys to their default values."""
 
-    NUM_VALUES = 5
-
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.reset_all_keys"
-
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
+    SCENARIO_NAME = "cit.default_values.reset_all_keys"
 
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
         assert defaults in ("optional", "required")
 
-        values = {}
-        for i in range(self.NUM_VALUES):
-            values[f"test_number_{i}"] = ("f64", 432.1 * i)
-
-        return create_defaults_file(temp_dir, self.instance_id(), values)
+        return create_defaults_file(temp_dir, self.instance_id(), RESET_DEFAULT_VALUES)
 
     def test_valid(
         self,
         defaults_file: Path | None,
         results: ScenarioResult,
-        logs_info_level: LogContainer,
+        logs_by_key: dict[Any, list[Any]],
         version: str,
     ):
         if version == "cpp":
@@ -408,20 +352,21 @@ class TestResetAllKeys(DefaultValuesScenario):
         assert defaults_file is not None
         assert results.return_code == ResultCode.SUCCESS
 
-        for i in range(self.NUM_VALUES):
-            logs = logs_info_level.get_logs("key", value=f"test_number_{i}")
+        for key, (_, default_value) in RESET_DEFAULT_VALUES.items():
+            set_value = RESET_SET_VALUES[key]
+            logs = logs_by_key.get(key, [])
 
             # Check values before set.
             assert logs[0].value_is_default
-            assert logs[0].current_value == 432.1 * i
+            assert logs[0].current_value == default_value
 
             # Check values after set.
             assert not logs[1].value_is_default
-            assert logs[1].current_value == 123.4 * i
+            assert logs[1].current_value == set_value
 
             # Check values after reset.
             assert logs[2].value_is_default
-            assert logs[2].current_value == 432.1 * i
+            assert logs[2].current_value == default_value
 
 
 @add_test_properties(
@@ -436,38 +381,20 @@ class TestResetAllKeys(DefaultValuesScenario):
 class TestResetSingleKey(DefaultValuesScenario):
     """Checks that resetting single key restores it to its default value."""
 
-    NUM_VALUES = 5
+    SCENARIO_NAME = "cit.default_values.reset_single_key"
     RESET_INDEX = 2
 
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.reset_single_key"
-
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
-
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
         assert defaults in ("optional", "required")
 
-        values = {}
-        for i in range(self.NUM_VALUES):
-            values[f"test_number_{i}"] = ("f64", 432.1 * i)
-
-        return create_defaults_file(temp_dir, self.instance_id(), values)
+        return create_defaults_file(temp_dir, self.instance_id(), RESET_DEFAULT_VALUES)
 
     def test_valid(
         self,
         defaults_file: Path | None,
         results: ScenarioResult,
-        logs_info_level: LogContainer,
+        logs_by_key: dict[Any, list[Any]],
         version: str,
     ):
         if version == "cpp":
@@ -475,34 +402,35 @@ class TestResetSingleKey(DefaultValuesScenario):
         assert defaults_file is not None
         assert results.return_code == ResultCode.SUCCESS
 
-        for i in range(self.NUM_VALUES):
-            logs = logs_info_level.get_logs("key", value=f"test_number_{i}")
+        for i, (key, (_, default_value)) in enumerate(RESET_DEFAULT_VALUES.items()):
+            set_value = RESET_SET_VALUES[key]
+            logs = logs_by_key.get(key, [])
 
             if i == self.RESET_INDEX:
                 # Check values before set.
                 assert logs[0].value_is_default
-                assert logs[0].current_value == 432.1 * i
+                assert logs[0].current_value == default_value
 
                 # Check values after set.
                 assert not logs[1].value_is_default
-                assert logs[1].current_value == 123.4 * i
+                assert logs[1].current_value == set_value
 
                 # Check values after reset.
                 assert logs[2].value_is_default
-                assert logs[2].current_value == 432.1 * i
+                assert logs[2].current_value == default_value
 
             else:
                 # Check values before set.
                 assert logs[0].value_is_default
-                assert logs[0].current_value == 432.1 * i
+                assert logs[0].current_value == default_value
 
                 # Check values after set.
                 assert not logs[1].value_is_default
-                assert logs[1].current_value == 123.4 * i
+                assert logs[1].current_value == set_value
 
                 # Check values after reset.
                 assert not logs[2].value_is_default
-                assert logs[2].current_value == 123.4 * i
+                assert logs[2].current_value == set_value
 
 
 @add_test_properties(
@@ -518,23 +446,10 @@ class TestResetSingleKey(DefaultValuesScenario):
 class TestChecksumOnProvidedDefaults(DefaultValuesScenario):
     """Ensures that a checksum file is created when opening KVS with defaults."""
 
+    SCENARIO_NAME = "cit.default_values.checksum"
     KEY = "test_number"
     VALUE = 111.1
 
-    @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return "cit.default_values.checksum"
-
-    @pytest.fixture(scope="class")
-    def test_config(self, temp_dir: Path, defaults: str) -> dict[str, Any]:
-        return {
-            "kvs_parameters": {
-                "instance_id": self.instance_id(),
-                "dir": str(temp_dir),
-                "defaults": defaults,
-            }
-        }
-
     @pytest.fixture(scope="class")
     def defaults_file(self, temp_dir: Path, defaults: str) -> Path | None:
         assert defaults in ("optional", "required", "without")
@@ -14,11 +14,33 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-from common import CommonScenario, ResultCode
+from common import VERSIONS, CommonScenario, ResultCode
 from test_properties import add_test_properties
 from testing_utils import LogContainer, ScenarioResult
 
-pytestmark = pytest.mark.parametrize("version", ["rust", "cpp"], scope="class")
+pytestmark = pytest.mark.parametrize("version", VERSIONS, scope="class")
+
+
+class MultipleKvsScenario(CommonScenario):
+    """
+    Common base implementation for multiple KVS tests.
+    """
+
+    @pytest.fixture(scope="class")
+    def logs_by_instance(self, logs_info_level: LogContainer) -> dict[Any, Any]:
+        """
+        First log with INFO level for each "instance" field value.
+        Collected in a single pass over logs.
+
+        Parameters
+        ----------
+        logs_info_level : LogContainer
+            Logs with messages with INFO level.
+        """
+        logs = {}
+        for log in logs_info_level.get_logs(field="instance"):
+            logs.setdefault(log.instance, log)
+        return logs
 
 
 @add_test_properties(
@@ -29,7 +51,7 @@ pytestmark = pytest.mark.parametrize("version", ["rust", "cpp"], scope="class")
     test_type="requirements-based",
     derivation_technique="requirements-analysis",
 )
-class TestMultipleInstanceIds(CommonScenario):
+class TestMultipleInstanceIds(MultipleKvsScenario):
     """Verifies that multiple KVS instances with different IDs store and retrieve independent values without interference."""
 
     @pytest.fixture(scope="class")
@@ -43,16 +65,16 @@ class TestMultipleInstanceIds(CommonScenario):
             "kvs_parameters_2": {"kvs_parameters": {"instance_id": 2, "dir": str(temp_dir)}},
         }
 
-    def test_ok(self, results: ScenarioResult, logs_info_level: LogContainer):
+    def test_ok(self, results: ScenarioResult, logs_by_instance: dict[Any, Any]):
         assert results.return_code == ResultCode.SUCCESS
 
         key = "number"
-        log1 = logs_info_level.find_log("instance", value="kvs1")
+        log1 = logs_by_instance.get("kvs1")
         assert log1 is not None
         assert log1.key == key
         assert round(log1.value, 1) == 111.1
 
-        log2 = logs_info_level.find_log("instance", value="kvs2")
+        log2 = logs_by_instance.get("kvs2")
         assert log2 is not None
         assert log2.key == key
         assert round(log2.value, 1) == 222.2
@@ -66,7 +88,7 @@ class TestMultipleInstanceIds(CommonScenario):
     test_type="requirements-based",
     derivation_technique="requirements-analysis",
 )
-class TestSameInstanceIdSameValue(CommonScenario):
+class TestSameInstanceIdSameValue(MultipleKvsScenario):
     """Checks that multiple KVS instances with the same ID and key maintain consistent values across instances."""
 
     @pytest.fixture(scope="class")
@@ -77,16 +99,16 @@ class TestSameInstanceIdSameValue(CommonScenario):
     def test_config(self, temp_dir: Path) -> dict[str, Any]:
         return {"kvs_parameters": {"instance_id": 1, "dir": str(temp_dir)}}
 
-    def test_ok(self, results: ScenarioResult, logs_info_level: LogContainer):
+    def test_ok(self, results: ScenarioResult, logs_by_instance: dict[Any, Any]):
         assert results.return_code == ResultCode.SUCCESS
 
         key = "number"
-        log1 = logs_info_level.find_log("instance", value="kvs1")
+        log1 = logs_by_instance.get("kvs1")
         assert log1 is not None
         assert log1.key == key
         assert round(log1.value, 1) == 111.1
 
-        log2 = logs_info_level.find_log("instance", value="kvs2")
+        log2 = logs_by_instance.get("kvs2")
         assert log2 is not None
         assert log2.key == key
         assert round(log2.value, 1) == 111.1
@@ -102,7 +124,7 @@ class TestSameInstanceIdSameValue(CommonScenario):
     test_type="requirements-based",
     derivation_technique="requirements-analysis",
 )
-class TestSameInstanceIdDifferentValue(CommonScenario):
+class TestSameInstanceIdDifferentValue(MultipleKvsScenario):
     """Verifies that changes in one KVS instance with a shared ID and key are reflected in another instance, demonstrating interference."""
 
     @pytest.fixture(scope="class")
@@ -113,18 +135,18 @@ class TestSameInstanceIdDifferentValue(CommonScenario):
     def test_config(self, temp_dir: Path) -> dict[str, Any]:
         return {"kvs_parameters": {"instance_id": 1, "dir": str(temp_dir)}}
 
-    def test_ok(self, results: ScenarioResult, logs_info_level: LogContainer):
+    def test_ok(self, results: ScenarioResult, logs_by_instance: dict[Any, Any]):
         assert results.return_code == ResultCode.SUCCESS
 
         # Assertions are same as in 'TestSameInstanceIdSameValue'.
         # Test scenario behavior differs underneath.
         key = "number"
-        log1 = logs_info_level.find_log("instance", value="kvs1")
+        log1 = logs_by_instance.get("kvs1")
         assert log1 is not None
         assert log1.key == key
         assert round(log1.value, 1) == 222.2
 
-        log2 = logs_info_level.find_log("instance", value="kvs2")
+        log2 = logs_by_instance.get("kvs2")
         assert log2 is not None
         assert log2.key == key
         assert round(log2.value, 1) == 222.2
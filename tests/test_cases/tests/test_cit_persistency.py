@@ -16,7 +16,7 @@ from typing import Any
 import pytest
 from common import CommonScenario, ResultCode
 from test_properties import add_test_properties
-from testing_utils import LogContainer, ScenarioResult
+from testing_utils import ScenarioResult
 
 pytestmark = pytest.mark.parametrize("version", ["rust"], scope="class")
 
@@ -30,6 +30,8 @@ class TestExplicitFlush(CommonScenario):
     """Verifies that disabling flush on exit but manually flushing ensures data is persisted correctly."""
 
     NUM_VALUES = 5
+    # Expected logged values, indexed by key number.
+    EXP_VALUES = tuple(f"Ok(F64({12.3 * i}))" for i in range(NUM_VALUES))
 
     @pytest.fixture(scope="class")
     def scenario_name(self) -> str:
@@ -44,10 +46,10 @@ class TestExplicitFlush(CommonScenario):
             }
         }
 
-    def test_data_stored(self, results: ScenarioResult, logs_info_level: LogContainer):
+    def test_data_stored(self, results: ScenarioResult, logs_by_key: dict[Any, list[Any]]):
         assert results.return_code == ResultCode.SUCCESS
 
-        for i in range(self.NUM_VALUES):
-            log = logs_info_level.find_log("key", value=f"test_number_{i}")
-            assert log is not None
-            assert log.value == f"Ok(F64({12.3 * i}))"
+        for i, exp_value in enumerate(self.EXP_VALUES):
+            logs = logs_by_key.get(f"test_number_{i}")
+            assert logs is not None
+            assert logs[0].value == exp_value
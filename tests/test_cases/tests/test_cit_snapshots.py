@@ -14,11 +14,11 @@ from pathlib import Path
 from typing import Any, Generator
 
 import pytest
-from common import CommonScenario, ResultCode, temp_dir_common
+from common import VERSIONS, CommonScenario, ResultCode, temp_dir_common
 from test_properties import add_test_properties
 from testing_utils import LogContainer, ScenarioResult
 
-pytestmark = pytest.mark.parametrize("version", ["rust", "cpp"], scope="class")
+pytestmark = pytest.mark.parametrize("version", VERSIONS, scope="class")
 
 
 class MaxSnapshotsScenario(CommonScenario):
@@ -80,9 +80,9 @@ class TestSnapshotCountFirstFlush(MaxSnapshotsScenario):
         count = test_config["count"]
         logs = logs_info_level.get_logs("snapshot_count")
         assert len(logs) == count + 1
-        for i in range(count):
-            expected = min(i, snapshot_max_count)
-            assert logs[i].snapshot_count == expected
+        act_counts = tuple(logs[i].snapshot_count for i in range(count))
+        exp_counts = tuple(min(i, snapshot_max_count) for i in range(count))
+        assert act_counts == exp_counts
 
         assert logs[-1].snapshot_count == min(count, snapshot_max_count)
 
@@ -299,9 +299,12 @@ class TestSnapshotPathsExist(CommonScenario):
         paths_log = logs_info_level.find_log("kvs_path")
         assert paths_log is not None
         assert paths_log.kvs_path == f"{temp_dir}/kvs_1_1.json"
-        assert Path(paths_log.kvs_path).exists()
         assert paths_log.hash_path == f"{temp_dir}/kvs_1_1.hash"
-        assert Path(paths_log.hash_path).exists()
+
+        # Check both files with a single directory listing.
+        file_names = {path.name for path in temp_dir.iterdir()}
+        assert "kvs_1_1.json" in file_names
+        assert "kvs_1_1.hash" in file_names
 
 
 @add_test_properties(
@@ -335,6 +338,9 @@ class TestSnapshotPathsNonexistent(CommonScenario):
         paths_log = logs_info_level.find_log("kvs_path")
         assert paths_log is not None
         assert paths_log.kvs_path == f"{temp_dir}/kvs_1_2.json"
-        assert not Path(paths_log.kvs_path).exists()
         assert paths_log.hash_path == f"{temp_dir}/kvs_1_2.hash"
-        assert not Path(paths_log.hash_path).exists()
+
+        # Check both files with a single directory listing.
+        file_names = {path.name for path in temp_dir.iterdir()}
+        assert "kvs_1_2.json" not in file_names
+        assert "kvs_1_2.hash" not in file_names
@@ -11,15 +11,14 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import json
-from abc import abstractmethod
 from typing import Any
 
 import pytest
-from common import CommonScenario, ResultCode
+from common import VERSIONS, CommonScenario, ResultCode
 from test_properties import add_test_properties
-from testing_utils import LogContainer, ScenarioResult
+from testing_utils import ScenarioResult
 
-pytestmark = pytest.mark.parametrize("version", ["cpp", "rust"], scope="class")
+pytestmark = pytest.mark.parametrize("version", VERSIONS, scope="class")
 
 
 @add_test_properties(
@@ -30,9 +29,12 @@ pytestmark = pytest.mark.parametrize("version", ["cpp", "rust"], scope="class")
     test_type="interface-test",
     derivation_technique="requirements-analysis",
 )
+@pytest.mark.xdist_group(name="default_kvs_dir")
 class TestSupportedDatatypesKeys(CommonScenario):
     """Verifies that KVS supports UTF-8 string keys for storing and retrieving values."""
 
+    EXP_KEYS = frozenset({"example", "emoji ✅❗😀", "greek ημα"})
+
     @pytest.fixture(scope="class")
     def scenario_name(self) -> str:
         return "cit.supported_datatypes.keys"
@@ -41,15 +43,10 @@ class TestSupportedDatatypesKeys(CommonScenario):
     def test_config(self) -> dict[str, Any]:
         return {"kvs_parameters": {"instance_id": 1}}
 
-    def test_ok(self, results: ScenarioResult, logs_info_level: LogContainer) -> None:
+    def test_ok(self, results: ScenarioResult, logs_by_key: dict[Any, list[Any]]) -> None:
         assert results.return_code == ResultCode.SUCCESS
 
-        logs = logs_info_level.get_logs(field="key")
-        act_keys = set(map(lambda x: x.key, logs))
-        exp_keys = {"example", "emoji ✅❗😀", "greek ημα"}
-
-        assert len(act_keys) == len(exp_keys)
-        assert len(act_keys.symmetric_difference(exp_keys)) == 0
+        assert set(logs_by_key) == self.EXP_KEYS
 
 
 @add_test_properties(
@@ -60,127 +57,70 @@ class TestSupportedDatatypesKeys(CommonScenario):
     test_type="interface-test",
     derivation_technique="requirements-analysis",
 )
+@pytest.mark.xdist_group(name="default_kvs_dir")
+@pytest.mark.parametrize(
+    ("exp_key", "exp_value"),
+    [
+        pytest.param("i32", -321, id="i32"),
+        pytest.param("u32", 1234, id="u32"),
+        pytest.param("i64", -123456789, id="i64"),
+        pytest.param("u64", 123456789, id="u64"),
+        pytest.param("f64", -5432.1, id="f64"),
+        pytest.param("bool", True, id="bool"),
+        pytest.param("str", "example", id="str"),
+        pytest.param(
+            "arr",
+            [
+                {"t": "f64", "v": 321.5},
+                {"t": "bool", "v": False},
+                {"t": "str", "v": "hello"},
+                {"t": "null", "v": None},
+                {"t": "arr", "v": []},
+                {
+                    "t": "obj",
+                    "v": {
+                        "sub-number": {
+                            "t": "f64",
+                            "v": 789,
+                        },
+                    },
+                },
+            ],
+            id="arr",
+        ),
+        pytest.param("obj", {"sub-number": {"t": "f64", "v": 789}}, id="obj"),
+    ],
+    scope="class",
+)
 class TestSupportedDatatypesValues(CommonScenario):
     """Verifies that KVS supports UTF-8 string keys for storing and retrieving values."""
 
-    @abstractmethod
-    def exp_key(self) -> str:
-        pass
-
-    @abstractmethod
-    def exp_value(self) -> Any:
-        pass
-
-    def exp_tagged(self) -> dict[str, Any]:
-        return {"t": self.exp_key(), "v": self.exp_value()}
-
     @pytest.fixture(scope="class")
-    def scenario_name(self) -> str:
-        return f"cit.supported_datatypes.values.{self.exp_key()}"
+    def scenario_name(self, exp_key: str) -> str:
+        return f"cit.supported_datatypes.values.{exp_key}"
 
     @pytest.fixture(scope="class")
     def test_config(self) -> dict[str, Any]:
         return {"kvs_parameters": {"instance_id": 1}}
 
-    def test_ok(self, results: ScenarioResult, logs_info_level: LogContainer) -> None:
+    def test_ok(
+        self,
+        results: ScenarioResult,
+        logs_by_key: dict[Any, list[Any]],
+        exp_key: str,
+        exp_value: Any,
+    ) -> None:
         assert results.return_code == ResultCode.SUCCESS
 
         # Get log containing type and value.
-        logs = logs_info_level.get_logs(field="key", value=self.exp_key())
+        logs = logs_by_key.get(exp_key, [])
         assert len(logs) == 1
         log = logs[0]
 
         # Assert key.
         act_key = log.key
-        assert act_key == self.exp_key()
+        assert act_key == exp_key
 
         # Assert values.
         act_value = json.loads(log.value)
-        assert act_value == self.exp_tagged()
-
-
-class TestSupportedDatatypesValues_I32(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "i32"
-
-    def exp_value(self) -> Any:
-        return -321
-
-
-class TestSupportedDatatypesValues_U32(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "u32"
-
-    def exp_value(self) -> Any:
-        return 1234
-
-
-class TestSupportedDatatypesValues_I64(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "i64"
-
-    def exp_value(self) -> Any:
-        return -123456789
-
-
-class TestSupportedDatatypesValues_U64(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "u64"
-
-    def exp_value(self) -> Any:
-        return 123456789
-
-
-class TestSupportedDatatypesValues_F64(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "f64"
-
-    def exp_value(self) -> Any:
-        return -5432.1
-
-
-class TestSupportedDatatypesValues_Bool(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "bool"
-
-    def exp_value(self) -> Any:
-        return True
-
-
-class TestSupportedDatatypesValues_String(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "str"
-
-    def exp_value(self) -> Any:
-        return "example"
-
-
-class TestSupportedDatatypesValues_Array(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "arr"
-
-    def exp_value(self) -> Any:
-        return [
-            {"t": "f64", "v": 321.5},
-            {"t": "bool", "v": False},
-            {"t": "str", "v": "hello"},
-            {"t": "null", "v": None},
-            {"t": "arr", "v": []},
-            {
-                "t": "obj",
-                "v": {
-                    "sub-number": {
-                        "t": "f64",
-                        "v": 789,
-                    },
-                },
-            },
-        ]
-
-
-class TestSupportedDatatypesValues_Object(TestSupportedDatatypesValues):
-    def exp_key(self) -> str:
-        return "obj"
-
-    def exp_value(self) -> Any:
-        return {"sub-number": {"t": "f64", "v": 789}}
+        assert act_value == {"t": exp_key, "v": exp_value}